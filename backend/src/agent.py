@@ -36,6 +36,8 @@ SCENARIOS = [
     "You are a museum tour guide and all the exhibits come to life.",
 ]
 
+SCENARIO_INDICES = list(range(len(SCENARIOS)))
+
 POSITIVE_REACTIONS = [
     "That was awesome! I loved how you handled {detail}. Great energy!",
     "Amazing performance! Your use of {detail} really stood out.",
@@ -57,100 +59,107 @@ CRITICAL_REACTIONS = [
     "The {detail} started well but fizzled — don’t be afraid to go big!",
 ]
 
-def get_random_reaction(detail="your performance"):
-    rtype = random.choice(["positive", "neutral", "critical"])
-    if rtype == "positive":
-        template = random.choice(POSITIVE_REACTIONS)
-    elif rtype == "neutral":
-        template = random.choice(NEUTRAL_REACTIONS)
-    else:
-        template = random.choice(CRITICAL_REACTIONS)
-    return template.format(detail=detail)
+# Every tone has the same number of templates, so one draw from the flat pool
+# is as likely to land on each tone as picking the tone first.
+ALL_REACTIONS = POSITIVE_REACTIONS + NEUTRAL_REACTIONS + CRITICAL_REACTIONS
+
+def get_random_reaction(detail: str = "your performance") -> str:
+    return random.choice(ALL_REACTIONS).format(detail=detail)
+
+
+# --- HOST PROMPTS ---
+HOST_INSTRUCTIONS = (
+    "You are the host of IMPROV BATTLE — energetic, fun, and clear.\n"
+    "GAME FLOW:\n"
+    "- Welcome contestant, get their name.\n"
+    "- Explain the game briefly.\n"
+    "- Run exactly 3 improv rounds.\n"
+    "Each round:\n"
+    "1. Present a scenario.\n"
+    "2. Say 'Action!' and listen.\n"
+    "3. When contestant finishes, call get_host_reaction.\n"
+    "4. Share reaction.\n"
+    "After 3 rounds, call end_game.\n"
+    "Keep responses short, punchy, and natural.\n"
+)
+
+WELCOME_GREETING = "Welcome to IMPROV BATTLE! I'm your host. What’s your name?"
 
 
 # --- AGENT ---
 class ImprovBattleAgent(Agent):
-    def __init__(self):
-        super().__init__(
-            instructions=(
-                "You are the host of IMPROV BATTLE — energetic, fun, and clear.\n"
-                "GAME FLOW:\n"
-                "- Welcome contestant, get their name.\n"
-                "- Explain the game briefly.\n"
-                "- Run exactly 3 improv rounds.\n"
-                "Each round:\n"
-                "1. Present a scenario.\n"
-                "2. Say 'Action!' and listen.\n"
-                "3. When contestant finishes, call get_host_reaction.\n"
-                "4. Share reaction.\n"
-                "After 3 rounds, call end_game.\n"
-                "Keep responses short, punchy, and natural.\n"
-            )
-        )
+    def __init__(self) -> None:
+        super().__init__(instructions=HOST_INSTRUCTIONS)
 
         self.state = {
             "player_name": "Ajit",
             "current_round": 0,
             "max_rounds": 3,
             "phase": "intro",
-            "scenarios_used": [],
+            "scenarios_used": set(),
+            "current_scenario": None,
             "reactions": [],
             "game_started": False
         }
 
     @function_tool
-    async def start_game(self, context: RunContext, player_name: str):
+    async def start_game(self, context: RunContext, player_name: str) -> str:
         self.state["player_name"] = player_name
         self.state["game_started"] = True
         self.state["phase"] = "intro"
         return f"Game started for {player_name}! Let's begin."
 
     @function_tool
-    async def present_scenario(self, context: RunContext):
+    async def present_scenario(self, context: RunContext) -> str:
         if self.state["current_round"] >= self.state["max_rounds"]:
             return "All rounds complete."
 
-        available = [s for s in SCENARIOS if s not in self.state["scenarios_used"]]
+        used = self.state["scenarios_used"]
+        available = [i for i in SCENARIO_INDICES if i not in used]
         if not available:
-            available = SCENARIOS
+            available = SCENARIO_INDICES
 
-        scenario = random.choice(available)
-        self.state["scenarios_used"].append(scenario)
+        idx = random.choice(available)
+        used.add(idx)
+        scenario = SCENARIOS[idx]
+        self.state["current_scenario"] = scenario
         self.state["current_round"] += 1
         self.state["phase"] = "awaiting_improv"
 
         return f"Round {self.state['current_round']}: {scenario}"
 
     @function_tool
-    async def get_host_reaction(self, context: RunContext, performance_summary: str):
+    async def get_host_reaction(self, context: RunContext, performance_summary: str) -> str:
         reaction = get_random_reaction(performance_summary)
         self.state["phase"] = "reacting"
 
         self.state["reactions"].append({
             "round": self.state["current_round"],
-            "scenario": self.state["scenarios_used"][-1],
+            "scenario": self.state["current_scenario"],
             "reaction": reaction
         })
 
         return reaction
 
     @function_tool
-    async def end_game(self, context: RunContext):
+    async def end_game(self, context: RunContext) -> str:
         self.state["phase"] = "done"
         return f"Improv Battle complete! {self.state['player_name']} finished {self.state['current_round']} rounds."
 
 
 # --- LIVEKIT RUNTIME ---
-def prewarm(proc: JobProcess):
-    proc.userdata["vad"] = silero.VAD.load()
+# The tokenizer only holds config and hands each TTS stream a fresh
+# sentence stream, so one instance can be shared by every session.
+SENTENCE_TOKENIZER = tokenize.basic.SentenceTokenizer(min_sentence_len=2)
 
-async def entrypoint(ctx: JobContext):
-    await ctx.connect()
+def prewarm(proc: JobProcess) -> None:
+    proc.userdata["vad"] = silero.VAD.load()
 
+async def entrypoint(ctx: JobContext) -> None:
     tts = murf.TTS(
         voice="en-US-terrell",
         style="Conversation",
-        tokenizer=tokenize.basic.SentenceTokenizer(min_sentence_len=2),
+        tokenizer=SENTENCE_TOKENIZER,
         text_pacing=True
     )
 
@@ -162,14 +171,16 @@ async def entrypoint(ctx: JobContext):
         vad=ctx.proc.userdata["vad"],
     )
 
+    # session.start() joins the room concurrently with prewarming the STT, LLM and
+    # TTS connections, so there is no separate ctx.connect() up front.
     await session.start(
         agent=ImprovBattleAgent(),
         room=ctx.room,
         room_input_options=RoomInputOptions(noise_cancellation=noise_cancellation.BVC())
     )
 
-    await session.agent.say(
-        "Welcome to IMPROV BATTLE! I'm your host. What’s your name?",
+    await session.say(
+        WELCOME_GREETING,
         allow_interruptions=True
     )
 